@@ -7,7 +7,8 @@ Makes configuration accessible throughout the app
 Validates configuration on startup'''
 
 
-from pydantic_settings import BaseSettings
+import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -20,6 +21,8 @@ class Settings(BaseSettings):
     
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    #Worker processes in production (DEBUG always runs a single reloading worker)
+    WORKERS: int = os.cpu_count() or 2
     
     MAX_TEXT_LENGTH: int = 1000
     MAX_BULK_SIZE: int = 50
@@ -28,6 +31,8 @@ class Settings(BaseSettings):
     USE_GOOGLE_API: bool = False
     GOOGLE_API_KEY: Optional[str] = None
     GOOGLE_PROJECT_ID: Optional[str] = None
+    #Max concurrent Google API calls per bulk request
+    GOOGLE_API_CONCURRENCY: int = 10
     
     #Database
     USE_DATABASE: bool = True
@@ -39,9 +44,10 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = False
     RATE_LIMIT_PER_MINUTE: int = 60
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8"
+    )
 
 
 #Initialize settings
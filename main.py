@@ -10,16 +10,21 @@ Starts the uvicorn server'''
 
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from datetime import datetime
+from typing import List, Optional
+import asyncio
+import hashlib
 import logging
+import time
+import orjson
 
 from models import TranslationRequest, BulkTranslationRequest, TranslationResponse, BulkTranslationResponse, HealthResponse
 from services.translation_service import TranslationService
 from services.logging_service import LoggingService
 from utils.validators import validate_language_code, validate_text_length
+from utils.timestamps import utc_timestamp
 from config import settings
 
 #logging
@@ -33,7 +38,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Translation Microservice",
     description="A lightweight, scalable translation API service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -48,74 +54,141 @@ app.add_middleware(
 translation_service = TranslationService()
 logging_service = LoggingService()
 
+#Pre-encoded /api/v1/languages body: static for the mock backend, refreshed after a TTL for Google
+LANGUAGES_CACHE_TTL = 3600.0
+_languages_body: Optional[bytes] = None
+_languages_expires_at = 0.0
+
+
+def _refresh_languages_body() -> bytes:
+    global _languages_body, _languages_expires_at
+    _languages_body = orjson.dumps({"languages": translation_service.get_supported_languages()})
+    _languages_expires_at = time.monotonic() + LANGUAGES_CACHE_TTL
+    return _languages_body
+
+
+_refresh_languages_body()
+
+
+def _translate_texts(texts: List[str], target_lang: str, source_lang: Optional[str]) -> List[str]:
+    return [
+        translation_service.translate(
+            text=text,
+            target_lang=target_lang,
+            source_lang=source_lang
+        )
+        for text in texts
+    ]
+
+
+async def _translate_texts_concurrently(
+    texts: List[str],
+    target_lang: str,
+    source_lang: Optional[str]
+) -> List[str]:
+    semaphore = asyncio.Semaphore(settings.GOOGLE_API_CONCURRENCY)
+    
+    async def translate_one(text: str) -> str:
+        async with semaphore:
+            return await translation_service.translate_async(text, target_lang, source_lang)
+    
+    return await asyncio.gather(*(translate_one(text) for text in texts))
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unhandled error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error", "detail": str(exc)}
     )
 
 
-@app.get("/", tags=["Root"])
-async def root():
-    return {
-        "service": "Translation Microservice",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "translate": "/api/v1/translate",
-            "bulk_translate": "/api/v1/translate/bulk",
-            "logs": "/api/v1/logs",
-            "supported_languages": "/api/v1/languages"
-        }
+#/ never changes, so its body and ETag are built once
+_ROOT_BODY = orjson.dumps({
+    "service": "Translation Microservice",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "translate": "/api/v1/translate",
+        "bulk_translate": "/api/v1/translate/bulk",
+        "logs": "/api/v1/logs",
+        "supported_languages": "/api/v1/languages"
     }
+})
+_ROOT_HEADERS = {
+    "ETag": f'"{hashlib.md5(_ROOT_BODY).hexdigest()}"',
+    "Cache-Control": "public, max-age=3600"
+}
+
+#/health body is re-encoded only when utc_timestamp() rolls over to a new second
+_HEALTH_HEADERS = {"Cache-Control": "no-cache"}
+_health_body = b""
+_health_timestamp = ""
+
+
+@app.get("/", tags=["Root"])
+async def root(request: Request):
+    if request.headers.get("if-none-match") == _ROOT_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    
+    return Response(content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-        service="translation-service",
-        version="1.0.0"
-    )
+    global _health_body, _health_timestamp
+    timestamp = utc_timestamp()
+    if timestamp != _health_timestamp:
+        _health_body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": timestamp.replace(" ", "T"),
+            "service": "translation-service",
+            "version": "1.0.0"
+        })
+        _health_timestamp = timestamp
+    
+    return Response(content=_health_body, media_type="application/json", headers=_HEALTH_HEADERS)
 
 
 @app.post("/api/v1/translate", response_model=TranslationResponse, tags=["Translation"])
 async def translate_text(request: TranslationRequest):
     try:
-        validate_text_length(request.text, settings.MAX_TEXT_LENGTH)
+        text = request.text
+        char_count = len(text)
+        
+        validate_text_length(text, settings.MAX_TEXT_LENGTH, length=char_count)
         validate_language_code(request.target_language)
         
         if request.source_language:
             validate_language_code(request.source_language)
         
         #Perform translation
-        translated_text = translation_service.translate(
-            text=request.text,
+        translated_text = await asyncio.to_thread(
+            translation_service.translate,
+            text=text,
             target_lang=request.target_language,
             source_lang=request.source_language
         )
         
-        log_entry = logging_service.log_translation(
-            original_text=request.text,
+        log_entry = await asyncio.to_thread(
+            logging_service.log_translation,
+            original_text=text,
             translated_text=translated_text,
             source_lang=request.source_language or "auto",
             target_lang=request.target_language,
-            char_count=len(request.text)
+            char_count=char_count
         )
         
-        logger.info(f"Translation completed: {request.target_language} - {len(request.text)} chars")
+        logger.info(f"Translation completed: {request.target_language} - {char_count} chars")
         
         return TranslationResponse(
-            original_text=request.text,
+            original_text=text,
             translated_text=translated_text,
             source_language=request.source_language or "auto",
             target_language=request.target_language,
             timestamp=log_entry["timestamp"],
-            character_count=len(request.text)
+            character_count=char_count
         )
         
     except ValueError as e:
@@ -143,23 +216,35 @@ async def bulk_translate(request: BulkTranslationRequest):
         for text in request.texts:
             validate_text_length(text, settings.MAX_TEXT_LENGTH)
         
-        translations = []
-        for text in request.texts:
-            translated = translation_service.translate(
-                text=text,
-                target_lang=request.target_language,
-                source_lang=request.source_language
+        if translation_service.use_google_api:
+            #Network-bound: overlap the API round-trips
+            translations = await _translate_texts_concurrently(
+                request.texts,
+                request.target_language,
+                request.source_language
             )
-            translations.append(translated)
-            
-            logging_service.log_translation(
-                original_text=text,
-                translated_text=translated,
-                source_lang=request.source_language or "auto",
-                target_lang=request.target_language,
-                char_count=len(text)
+        else:
+            #One thread hop for the whole batch rather than one per text
+            translations = await asyncio.to_thread(
+                _translate_texts,
+                request.texts,
+                request.target_language,
+                request.source_language
             )
         
+        rows = [
+            {
+                "original_text": text,
+                "translated_text": translated,
+                "source_lang": request.source_language or "auto",
+                "target_lang": request.target_language,
+                "char_count": len(text)
+            }
+            for text, translated in zip(request.texts, translations)
+        ]
+        
+        await asyncio.to_thread(logging_service.log_translations_bulk, rows)
+        
         logger.info(f"Bulk translation completed: {len(translations)} texts")
         
         return BulkTranslationResponse(
@@ -167,7 +252,7 @@ async def bulk_translate(request: BulkTranslationRequest):
             target_language=request.target_language,
             source_language=request.source_language or "auto",
             count=len(translations),
-            timestamp=datetime.utcnow()
+            timestamp=utc_timestamp()
         )
         
     except ValueError as e:
@@ -184,7 +269,7 @@ async def get_logs(limit: int = 50):
         if limit > 500:
             limit = 500
         
-        logs = logging_service.get_logs(limit=limit)
+        logs = await asyncio.to_thread(logging_service.get_logs, limit=limit)
         return {
             "count": len(logs),
             "logs": logs
@@ -197,7 +282,7 @@ async def get_logs(limit: int = 50):
 @app.get("/api/v1/logs/stats", tags=["Logging"])
 async def get_statistics():
     try:
-        stats = logging_service.get_statistics()
+        stats = await asyncio.to_thread(logging_service.get_statistics)
         return stats
     except Exception as e:
         logger.error(f"Error retrieving statistics: {str(e)}")
@@ -206,8 +291,20 @@ async def get_statistics():
 
 @app.get("/api/v1/languages", tags=["Reference"])
 async def get_supported_languages():
+    body = _languages_body
+    if translation_service.use_google_api and time.monotonic() >= _languages_expires_at:
+        body = await asyncio.to_thread(_refresh_languages_body)
+    
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/api/v1/debug/cache", tags=["Debug"], include_in_schema=settings.DEBUG)
+async def get_cache_info():
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    
     return {
-        "languages": translation_service.get_supported_languages()
+        "translation_cache": translation_service.cache_info()
     }
 
 
@@ -216,5 +313,10 @@ if __name__ == "__main__":
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        limit_concurrency=1000,
+        timeout_keep_alive=30
     )
\ No newline at end of file
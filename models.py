@@ -6,7 +6,7 @@ Ensures correct data types
 Provides automatic API documentation
 Serializes response data'''
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 
@@ -17,55 +17,62 @@ class TranslationRequest(BaseModel):
     target_language: str = Field(..., description="Target language ISO code", min_length=2, max_length=5)
     source_language: Optional[str] = Field(None, description="Source language ISO code (auto-detect if not provided)")
     
-    @validator('text')
+    @field_validator('text')
+    @classmethod
     def text_not_empty(cls, v):
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Text cannot be empty")
-        return v.strip()
+        return v
     
-    @validator('target_language', 'source_language')
+    @field_validator('target_language', 'source_language')
+    @classmethod
     def normalize_language_code(cls, v):
         if v:
             return v.lower().strip()
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "text": "Hello, how are you?",
                 "target_language": "ta",
                 "source_language": "en"
             }
         }
+    )
 
 
 class BulkTranslationRequest(BaseModel):
     """Request model for bulk translation"""
-    texts: List[str] = Field(..., description="List of texts to translate", min_items=1, max_items=50)
+    texts: List[str] = Field(..., description="List of texts to translate", min_length=1, max_length=50)
     target_language: str = Field(..., description="Target language ISO code")
     source_language: Optional[str] = Field(None, description="Source language ISO code")
     
-    @validator('texts')
+    @field_validator('texts')
+    @classmethod
     def validate_texts(cls, v):
-        cleaned = [text.strip() for text in v if text.strip()]
+        cleaned = [stripped for stripped in (text.strip() for text in v) if stripped]
         if not cleaned:
             raise ValueError("At least one non-empty text is required")
         return cleaned
     
-    @validator('target_language', 'source_language')
+    @field_validator('target_language', 'source_language')
+    @classmethod
     def normalize_language_code(cls, v):
         if v:
             return v.lower().strip()
         return v
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "texts": ["Hello", "Good morning", "Thank you"],
                 "target_language": "hi",
                 "source_language": "en"
             }
         }
+    )
 
 
 class TranslationResponse(BaseModel):
@@ -77,8 +84,8 @@ class TranslationResponse(BaseModel):
     timestamp: datetime
     character_count: int
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "original_text": "Hello, how are you?",
                 "translated_text": "வணக்கம், நீங்கள் எப்படி இருக்கிறீர்கள்?",
@@ -88,6 +95,7 @@ class TranslationResponse(BaseModel):
                 "character_count": 19
             }
         }
+    )
 
 
 class BulkTranslationResponse(BaseModel):
@@ -98,8 +106,8 @@ class BulkTranslationResponse(BaseModel):
     count: int
     timestamp: datetime
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "translations": ["வணக்கம்", "காலை வணக்கம்", "நன்றி"],
                 "target_language": "ta",
@@ -108,6 +116,7 @@ class BulkTranslationResponse(BaseModel):
                 "timestamp": "2025-09-30T10:30:00"
             }
         }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -117,8 +126,8 @@ class HealthResponse(BaseModel):
     service: str
     version: str
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2025-09-30T10:30:00",
@@ -126,3 +135,4 @@ class HealthResponse(BaseModel):
                 "version": "1.0.0"
             }
         }
+    )
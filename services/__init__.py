@@ -1,21 +1,6 @@
-
 #Services module for translation microservice
 
 from .translation_service import TranslationService
 from .logging_service import LoggingService
 
 __all__ = ['TranslationService', 'LoggingService']
-
-from utils.validators import (
-    validate_language_code,
-    validate_text_length,
-    sanitize_text,
-    is_valid_bulk_request
-)
-
-__all__ = [
-    'validate_language_code',
-    'validate_text_length',
-    'sanitize_text',
-    'is_valid_bulk_request'
-]
\ No newline at end of file
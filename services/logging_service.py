@@ -8,32 +8,109 @@ Manages database operations'''
 
 import sqlite3
 import logging
-from datetime import datetime
+import atexit
+import threading
+import time
+from collections import deque
+from itertools import count
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from utils.timestamps import utc_timestamp, utc_timestamp_ago
+
 logger = logging.getLogger(__name__)
 
+#get_logs shortens texts to this many characters on every path
+_PREVIEW_LENGTH = 100
+
+#Hot-path statements live at module level so every call hits the
+#connection's prepared-statement cache with the same SQL text
+_INSERT_SQL = '''
+    INSERT INTO translations 
+    (original_text, translated_text, source_lang, target_lang, 
+     char_count, timestamp, ip_address, user_agent)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SELECT_LOGS_SQL = f'''
+    SELECT id,
+           substr(original_text, 1, {_PREVIEW_LENGTH}) AS original_text,
+           substr(translated_text, 1, {_PREVIEW_LENGTH}) AS translated_text,
+           source_lang, target_lang, char_count, timestamp, ip_address
+    FROM translations
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+
+_LOG_COLUMNS = (
+    'original_text', 'translated_text', 'source_lang', 'target_lang',
+    'char_count', 'timestamp', 'ip_address', 'user_agent'
+)
+
+
+def _preview(log_entry: Dict) -> Dict:
+    """Copy of an in-memory entry with texts shortened like the SQL path"""
+    preview = dict(log_entry)
+    preview['original_text'] = log_entry['original_text'][:_PREVIEW_LENGTH]
+    preview['translated_text'] = log_entry['translated_text'][:_PREVIEW_LENGTH]
+    return preview
+
 
 class LoggingService:
     """Service for logging translation requests"""
     
-    def __init__(self, db_path: str = "translation_logs.db", use_db: bool = True):
+    def __init__(
+        self,
+        db_path: str = "translation_logs.db",
+        use_db: bool = True,
+        stats_ttl: float = 5.0,
+        memory_log_limit: int = 10_000
+    ):
         self.db_path = db_path
         self.use_db = use_db
         
-        self.memory_logs = []
+        #Short-lived cache of get_statistics() for polling dashboards
+        self.stats_ttl = stats_ttl
+        self._stats_cache: Optional[Dict] = None
+        self._stats_cache_time = 0.0
+        #Bumped by clear_logs so a computation that raced with it isn't cached
+        self._stats_generation = 0
+        
+        #Bounded so a long database outage can't grow the fallback without limit
+        self.memory_logs = deque(maxlen=memory_log_limit)
+        self._memory_log_ids = count(1)
+        
+        #Single long-lived connection shared by all requests, guarded by _lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         
         if use_db:
             self._initialize_database()
         
         logger.info(f"LoggingService initialized (Database: {use_db})")
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the shared connection with the per-connection PRAGMAs applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=128
+        )
+        #journal_mode is persisted in the database file, the rest are per-connection
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-2000')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA wal_autocheckpoint=1000')
+        return conn
+    
     def _initialize_database(self):
         """Initialize SQLite database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            self._conn = self._connect()
+            cursor = self._conn.cursor()
             
             #Create translations table
             cursor.execute('''
@@ -59,8 +136,13 @@ class LoggingService:
                 ON translations(target_lang)
             ''')
             
-            conn.commit()
-            conn.close()
+            #Covering index so get_statistics never touches the table rows
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_stats 
+                ON translations(timestamp, char_count, target_lang)
+            ''')
+            
+            atexit.register(self.close)
             
             logger.info(f"Database initialized at {self.db_path}")
         except Exception as e:
@@ -68,6 +150,18 @@ class LoggingService:
             logger.warning("Falling back to in-memory logging")
             self.use_db = False
     
+    def close(self):
+        """Checkpoint the WAL and close the shared connection"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            except Exception as e:
+                logger.error(f"Failed to checkpoint database: {str(e)}")
+            self._conn.close()
+            self._conn = None
+    
     def log_translation(
         self,
         original_text: str,
@@ -78,11 +172,11 @@ class LoggingService:
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None
     ) -> Dict:
-        timestamp = datetime.utcnow()
+        timestamp = utc_timestamp()
         
         log_entry = {
-            'original_text': original_text[:100],  # Truncate for storage
-            'translated_text': translated_text[:100],
+            'original_text': original_text,
+            'translated_text': translated_text,
             'source_lang': source_lang,
             'target_lang': target_lang,
             'char_count': char_count,
@@ -93,95 +187,141 @@ class LoggingService:
         
         if self.use_db:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    INSERT INTO translations 
-                    (original_text, translated_text, source_lang, target_lang, 
-                     char_count, timestamp, ip_address, user_agent)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    log_entry['original_text'],
-                    log_entry['translated_text'],
-                    log_entry['source_lang'],
-                    log_entry['target_lang'],
-                    log_entry['char_count'],
-                    log_entry['timestamp'],
-                    log_entry['ip_address'],
-                    log_entry['user_agent']
-                ))
+                with self._lock:
+                    cursor = self._conn.execute(
+                        _INSERT_SQL,
+                        tuple(log_entry[col] for col in _LOG_COLUMNS)
+                    )
                 
                 log_entry['id'] = cursor.lastrowid
-                conn.commit()
-                conn.close()
             except Exception as e:
                 logger.error(f"Failed to log to database: {str(e)}")
-                self.memory_logs.append(log_entry)
+                self._remember([log_entry])
         else:
-            log_entry['id'] = len(self.memory_logs) + 1
-            self.memory_logs.append(log_entry)
+            self._remember([log_entry], assign_ids=True)
         
         return log_entry
     
-    def get_logs(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+    def log_translations_bulk(self, entries: List[Dict]) -> List[Dict]:
+        """Log several translations in a single transaction"""
+        timestamp = utc_timestamp()
+        
+        log_entries = [
+            {
+                'original_text': entry['original_text'],
+                'translated_text': entry['translated_text'],
+                'source_lang': entry['source_lang'],
+                'target_lang': entry['target_lang'],
+                'char_count': entry['char_count'],
+                'timestamp': timestamp,
+                'ip_address': entry.get('ip_address'),
+                'user_agent': entry.get('user_agent')
+            }
+            for entry in entries
+        ]
+        
         if self.use_db:
             try:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    SELECT id, original_text, translated_text, source_lang, 
-                           target_lang, char_count, timestamp, ip_address
-                    FROM translations
-                    ORDER BY timestamp DESC
-                    LIMIT ? OFFSET ?
-                ''', (limit, offset))
+                rows = [tuple(log_entry[col] for col in _LOG_COLUMNS) for log_entry in log_entries]
+                with self._lock:
+                    self._conn.execute('BEGIN')
+                    try:
+                        self._conn.executemany(_INSERT_SQL, rows)
+                        #The transaction holds the write lock, so the batch got
+                        #consecutive AUTOINCREMENT ids ending at last_insert_rowid()
+                        last_id = self._conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+                        self._conn.execute('COMMIT')
+                    except Exception:
+                        #Never leave the shared autocommit connection inside a transaction
+                        if self._conn.in_transaction:
+                            self._conn.execute('ROLLBACK')
+                        raise
                 
-                rows = cursor.fetchall()
-                conn.close()
+                first_id = last_id - len(log_entries) + 1
+                for offset, log_entry in enumerate(log_entries):
+                    log_entry['id'] = first_id + offset
+            except Exception as e:
+                logger.error(f"Failed to log to database: {str(e)}")
+                self._remember(log_entries)
+        else:
+            self._remember(log_entries, assign_ids=True)
+        
+        return log_entries
+    
+    def _remember(self, log_entries: List[Dict], assign_ids: bool = False):
+        """Append entries to the in-memory log under the lock"""
+        with self._lock:
+            for log_entry in log_entries:
+                if assign_ids:
+                    log_entry['id'] = next(self._memory_log_ids)
+                self.memory_logs.append(log_entry)
+    
+    def _memory_snapshot(self) -> List[Dict]:
+        """Copy of the in-memory log, safe to iterate while other threads append"""
+        with self._lock:
+            return list(self.memory_logs)
+    
+    def get_logs(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+        if self.use_db:
+            try:
+                with self._lock:
+                    cursor = self._conn.cursor()
+                    cursor.row_factory = sqlite3.Row
+                    
+                    rows = cursor.execute(_SELECT_LOGS_SQL, (limit, offset)).fetchall()
                 
                 return [dict(row) for row in rows]
             except Exception as e:
                 logger.error(f"Failed to retrieve logs from database: {str(e)}")
-                return self.memory_logs[-limit:] if self.memory_logs else []
+                return [_preview(log) for log in self._memory_snapshot()[-limit:]]
         else:
-            start = max(0, len(self.memory_logs) - offset - limit)
-            end = len(self.memory_logs) - offset if offset > 0 else len(self.memory_logs)
-            return self.memory_logs[start:end][::-1]
+            memory_logs = self._memory_snapshot()
+            start = max(0, len(memory_logs) - offset - limit)
+            end = len(memory_logs) - offset if offset > 0 else len(memory_logs)
+            return [_preview(log) for log in memory_logs[start:end]][::-1]
     
     def get_statistics(self) -> Dict:
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_time < self.stats_ttl:
+            return self._stats_cache
+        
+        generation = self._stats_generation
+        stats = self._compute_statistics()
+        with self._lock:
+            if generation == self._stats_generation:
+                self._stats_cache = stats
+                self._stats_cache_time = now
+        return stats
+    
+    def _compute_statistics(self) -> Dict:
         if self.use_db:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                
-                cursor.execute('SELECT COUNT(*) FROM translations')
-                total = cursor.fetchone()[0]
-                
-                cursor.execute('SELECT SUM(char_count) FROM translations')
-                total_chars = cursor.fetchone()[0] or 0
-                
-                cursor.execute('''
-                    SELECT target_lang, COUNT(*) as count
-                    FROM translations
-                    GROUP BY target_lang
-                    ORDER BY count DESC
-                    LIMIT 5
-                ''')
-                popular_languages = [
-                    {'language': row[0], 'count': row[1]}
-                    for row in cursor.fetchall()
-                ]
-                
-                cursor.execute('''
-                    SELECT COUNT(*) FROM translations
-                    WHERE datetime(timestamp) > datetime('now', '-1 day')
-                ''')
-                recent_count = cursor.fetchone()[0]
-                
-                conn.close()
+                with self._lock:
+                    cursor = self._conn.cursor()
+                    
+                    cursor.execute('SELECT COUNT(*), COALESCE(SUM(char_count), 0) FROM translations')
+                    total, total_chars = cursor.fetchone()
+                    
+                    cursor.execute('''
+                        SELECT target_lang, COUNT(*) as count
+                        FROM translations
+                        GROUP BY target_lang
+                        ORDER BY count DESC
+                        LIMIT 5
+                    ''')
+                    popular_languages = [
+                        {'language': row[0], 'count': row[1]}
+                        for row in cursor.fetchall()
+                    ]
+                    
+                    #Compare raw strings so idx_timestamp can be used; the cutoff
+                    #uses the same 'YYYY-MM-DD HH:MM:SS' layout the rows are stored in
+                    cutoff = utc_timestamp_ago(24 * 60 * 60)
+                    cursor.execute(
+                        'SELECT COUNT(*) FROM translations WHERE timestamp > ?',
+                        (cutoff,)
+                    )
+                    recent_count = cursor.fetchone()[0]
                 
                 return {
                     'total_translations': total,
@@ -192,11 +332,12 @@ class LoggingService:
             except Exception as e:
                 logger.error(f"Failed to get statistics from database: {str(e)}")
         
-        total = len(self.memory_logs)
-        total_chars = sum(log['char_count'] for log in self.memory_logs)
+        memory_logs = self._memory_snapshot()
+        total = len(memory_logs)
+        total_chars = sum(log['char_count'] for log in memory_logs)
 
         lang_counts = {}
-        for log in self.memory_logs:
+        for log in memory_logs:
             lang = log['target_lang']
             lang_counts[lang] = lang_counts.get(lang, 0) + 1
         
@@ -215,14 +356,19 @@ class LoggingService:
     def clear_logs(self):
         if self.use_db:
             try:
-                conn = sqlite3.connect(self.db_path)
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM translations')
-                conn.commit()
-                conn.close()
+                with self._lock:
+                    self._conn.execute('DELETE FROM translations')
+                    self._invalidate_stats()
                 logger.info("Database logs cleared")
             except Exception as e:
                 logger.error(f"Failed to clear database logs: {str(e)}")
         else:
-            self.memory_logs.clear()
-            logger.info("In-memory logs cleared")
\ No newline at end of file
+            with self._lock:
+                self.memory_logs.clear()
+                self._invalidate_stats()
+            logger.info("In-memory logs cleared")
+    
+    def _invalidate_stats(self):
+        """Drop cached statistics; caller holds _lock"""
+        self._stats_cache = None
+        self._stats_generation += 1
\ No newline at end of file
@@ -7,101 +7,148 @@ Manages translation logic
 Switches between translation modes
 Provides list of supported languages'''
 
+import asyncio
+import functools
 import logging
-from typing import Optional, Dict
+import re
+from types import MappingProxyType
+from typing import Optional, Dict, FrozenSet, Mapping, Tuple
 
 logger = logging.getLogger(__name__)
 
+#mock translation dictionary, built once at import and shared read-only by every instance
+_MOCK_TRANSLATIONS = MappingProxyType({
+    'en_ta': MappingProxyType({
+        'hello': 'வணக்கம்',
+        'good morning': 'காலை வணக்கம்',
+        'good evening': 'மாலை வணக்கம்',
+        'thank you': 'நன்றி',
+        'please': 'தயவுசெய்து',
+        'yes': 'ஆம்',
+        'no': 'இல்லை',
+        'how are you': 'நீங்கள் எப்படி இருக்கிறீர்கள்',
+        'goodbye': 'பிரியாவிடை',
+        'welcome': 'வரவேற்கிறோம்',
+    }),
+    'en_hi': MappingProxyType({
+        'hello': 'नमस्ते',
+        'good morning': 'सुप्रभात',
+        'good evening': 'शुभ संध्या',
+        'thank you': 'धन्यवाद',
+        'please': 'कृपया',
+        'yes': 'हाँ',
+        'no': 'नहीं',
+        'how are you': 'आप कैसे हैं',
+        'goodbye': 'अलविदा',
+        'welcome': 'स्वागत है',
+    }),
+    'en_kn': MappingProxyType({
+        'hello': 'ನಮಸ್ಕಾರ',
+        'good morning': 'ಶುಭೋದಯ',
+        'good evening': 'ಶುಭ ಸಂಜೆ',
+        'thank you': 'ಧನ್ಯವಾದ',
+        'please': 'ದಯವಿಟ್ಟು',
+        'yes': 'ಹೌದು',
+        'no': 'ಇಲ್ಲ',
+        'how are you': 'ನೀವು ಹೇಗಿದ್ದೀರಿ',
+        'goodbye': 'ವಿದಾಯ',
+        'welcome': 'ಸ್ವಾಗತ',
+    }),
+    'en_bn': MappingProxyType({
+        'hello': 'হ্যালো',
+        'good morning': 'সুপ্রভাত',
+        'good evening': 'শুভ সন্ধ্যা',
+        'thank you': 'ধন্যবাদ',
+        'please': 'দয়া করে',
+        'yes': 'হ্যাঁ',
+        'no': 'না',
+        'how are you': 'তুমি কেমন আছো',
+        'goodbye': 'বিদায়',
+        'welcome': 'স্বাগতম',
+    }),
+    'en_es': MappingProxyType({
+        'hello': 'hola',
+        'good morning': 'buenos días',
+        'good evening': 'buenas noches',
+        'thank you': 'gracias',
+        'please': 'por favor',
+        'yes': 'sí',
+        'no': 'no',
+        'how are you': 'cómo estás',
+        'goodbye': 'adiós',
+        'welcome': 'bienvenido',
+    }),
+    'en_fr': MappingProxyType({
+        'hello': 'bonjour',
+        'good morning': 'bonjour',
+        'good evening': 'bonsoir',
+        'thank you': 'merci',
+        'please': "s'il vous plaît",
+        'yes': 'oui',
+        'no': 'non',
+        'how are you': 'comment allez-vous',
+        'goodbye': 'au revoir',
+        'welcome': 'bienvenue',
+    }),
+})
+
+#Flat (source, target, phrase) -> translation view of the table above, so a
+#lookup is one hash probe; _MOCK_PAIRS answers "is this pair mocked at all"
+_MOCK_TABLE: Mapping[Tuple[str, str, str], str] = MappingProxyType({
+    (source, target, phrase): translation
+    for pair, phrases in _MOCK_TRANSLATIONS.items()
+    for source, target in [pair.split('_')]
+    for phrase, translation in phrases.items()
+})
+_MOCK_PAIRS: FrozenSet[Tuple[str, str]] = frozenset(
+    tuple(pair.split('_')) for pair in _MOCK_TRANSLATIONS
+)
+
+#Languages offered by the mock backend
+SUPPORTED_LANGUAGES: Dict[str, str] = {
+    'en': 'English',
+    'ta': 'Tamil',
+    'hi': 'Hindi',
+    'kn': 'Kannada',
+    'bn': 'Bengali',
+    'es': 'Spanish',
+    'fr': 'French',
+    'de': 'German',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'ru': 'Russian',
+    'ja': 'Japanese',
+    'zh': 'Chinese',
+    'ar': 'Arabic',
+    'ko': 'Korean',
+}
+
 
 class TranslationService:
-    def __init__(self, use_google_api: bool = False, api_key: Optional[str] = None):
+    #Words, whitespace runs and punctuation runs, in order
+    _TOKEN_RE = re.compile(r"(\w+)|(\s+)|([^\w\s]+)", re.UNICODE)
+    
+    def __init__(
+        self,
+        use_google_api: bool = False,
+        api_key: Optional[str] = None,
+        cache_size: int = 10_000
+    ):
         self.use_google_api = use_google_api
         self.api_key = api_key
         
-        self.mock_translations = self._initialize_mock_translations()
+        self.mock_translations = _MOCK_TRANSLATIONS
+        
+        #Bounded per-instance memo of mock results, keyed on (text, target, source)
+        self._translate_mock_cached = functools.lru_cache(maxsize=cache_size)(
+            self._translate_with_mock
+        )
         
         if use_google_api and api_key:
             self._initialize_google_translate()
         
         logger.info(f"TranslationService initialized (Google API: {use_google_api})")
     
-    def _initialize_mock_translations(self) -> Dict:
-        #mock translation dictionary
-        return {
-            'en_ta': {
-                'hello': 'வணக்கம்',
-                'good morning': 'காலை வணக்கம்',
-                'good evening': 'மாலை வணக்கம்',
-                'thank you': 'நன்றி',
-                'please': 'தயவுசெய்து',
-                'yes': 'ஆம்',
-                'no': 'இல்லை',
-                'how are you': 'நீங்கள் எப்படி இருக்கிறீர்கள்',
-                'goodbye': 'பிரியாவிடை',
-                'welcome': 'வரவேற்கிறோம்',
-            },
-            'en_hi': {
-                'hello': 'नमस्ते',
-                'good morning': 'सुप्रभात',
-                'good evening': 'शुभ संध्या',
-                'thank you': 'धन्यवाद',
-                'please': 'कृपया',
-                'yes': 'हाँ',
-                'no': 'नहीं',
-                'how are you': 'आप कैसे हैं',
-                'goodbye': 'अलविदा',
-                'welcome': 'स्वागत है',
-            },
-            'en_kn': {
-                'hello': 'ನಮಸ್ಕಾರ',
-                'good morning': 'ಶುಭೋದಯ',
-                'good evening': 'ಶುಭ ಸಂಜೆ',
-                'thank you': 'ಧನ್ಯವಾದ',
-                'please': 'ದಯವಿಟ್ಟು',
-                'yes': 'ಹೌದು',
-                'no': 'ಇಲ್ಲ',
-                'how are you': 'ನೀವು ಹೇಗಿದ್ದೀರಿ',
-                'goodbye': 'ವಿದಾಯ',
-                'welcome': 'ಸ್ವಾಗತ',
-            },
-            'en_bn': {
-                'hello': 'হ্যালো',
-                'good morning': 'সুপ্রভাত',
-                'good evening': 'শুভ সন্ধ্যা',
-                'thank you': 'ধন্যবাদ',
-                'please': 'দয়া করে',
-                'yes': 'হ্যাঁ',
-                'no': 'না',
-                'how are you': 'তুমি কেমন আছো',
-                'goodbye': 'বিদায়',
-                'welcome': 'স্বাগতম',
-            },
-            'en_es': {
-                'hello': 'hola',
-                'good morning': 'buenos días',
-                'good evening': 'buenas noches',
-                'thank you': 'gracias',
-                'please': 'por favor',
-                'yes': 'sí',
-                'no': 'no',
-                'how are you': 'cómo estás',
-                'goodbye': 'adiós',
-                'welcome': 'bienvenido',
-            },
-            'en_fr': {
-                'hello': 'bonjour',
-                'good morning': 'bonjour',
-                'good evening': 'bonsoir',
-                'thank you': 'merci',
-                'please': "s'il vous plaît",
-                'yes': 'oui',
-                'no': 'non',
-                'how are you': 'comment allez-vous',
-                'goodbye': 'au revoir',
-                'welcome': 'bienvenue',
-            },
-        }
-    
     def _initialize_google_translate(self):
         try:
             from google.cloud import translate_v2 as translate
@@ -123,7 +170,20 @@ class TranslationService:
         if self.use_google_api:
             return self._translate_with_google(text, target_lang, source_lang)
         else:
-            return self._translate_with_mock(text, target_lang, source_lang)
+            return self._translate_mock_cached(text, target_lang, source_lang)
+    
+    async def translate_async(
+        self,
+        text: str,
+        target_lang: str,
+        source_lang: Optional[str] = None
+    ) -> str:
+        #The Google client is blocking, so run it on a worker thread
+        return await asyncio.to_thread(self.translate, text, target_lang, source_lang)
+    
+    def cache_info(self) -> Dict:
+        """Hit/miss counters of the mock translation cache"""
+        return self._translate_mock_cached.cache_info()._asdict()
     
     def _translate_with_google(
         self,
@@ -158,30 +218,36 @@ class TranslationService:
         #Default source language to English if not specified
         source = source_lang or 'en'
         
-        dict_key = f"{source}_{target_lang}"
-        
-        if dict_key not in self.mock_translations:
+        if (source, target_lang) not in _MOCK_PAIRS:
             #Return a formatted response indicating mock translation
             return f"[MOCK-{target_lang.upper()}] {text}"
         
         text_lower = text.lower().strip()
-        translation_dict = self.mock_translations[dict_key]
         
-        if text_lower in translation_dict:
-            return translation_dict[text_lower]
+        translation = _MOCK_TABLE.get((source, target_lang, text_lower))
+        if translation is not None:
+            return translation
         
-        words = text_lower.split()
-        translated_words = []
+        #Single pass: translate words, keep punctuation, and collapse each
+        #whitespace run to one space (text_lower is already stripped)
+        translated_parts = []
+        matched = False
         
-        for word in words:
-            clean_word = word.strip('.,!?;:')
-            if clean_word in translation_dict:
-                translated_words.append(translation_dict[clean_word])
+        for match in self._TOKEN_RE.finditer(text_lower):
+            word, space = match.group(1, 2)
+            if space is not None:
+                translated_parts.append(' ')
+                continue
+            
+            translation = _MOCK_TABLE.get((source, target_lang, word)) if word is not None else None
+            if translation is not None:
+                translated_parts.append(translation)
+                matched = True
             else:
-                translated_words.append(word)
+                translated_parts.append(match.group())
         
-        if any(w in translation_dict for w in [w.strip('.,!?;:') for w in words]):
-            return ' '.join(translated_words)
+        if matched:
+            return ''.join(translated_parts)
         
         return f"[MOCK-{target_lang.upper()}] {text}"
     
@@ -194,20 +260,4 @@ class TranslationService:
             except Exception as e:
                 logger.error(f"Failed to get supported languages: {str(e)}")
 
-        return {
-            'en': 'English',
-            'ta': 'Tamil',
-            'hi': 'Hindi',
-            'kn': 'Kannada',
-            'bn': 'Bengali',
-            'es': 'Spanish',
-            'fr': 'French',
-            'de': 'German',
-            'it': 'Italian',
-            'pt': 'Portuguese',
-            'ru': 'Russian',
-            'ja': 'Japanese',
-            'zh': 'Chinese',
-            'ar': 'Arabic',
-            'ko': 'Korean',
-        }
\ No newline at end of file
+        return SUPPORTED_LANGUAGES
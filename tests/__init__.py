@@ -1,25 +1 @@
-#Services module for translation microservice
-
-from services.translation_service import TranslationService
-from services.logging_service import LoggingService
-
-__all__ = ['TranslationService', 'LoggingService']
-
-
-# utils/__init__.py
-"""
-Utilities module for translation microservice
-"""
-from utils.validators import (
-    validate_language_code,
-    validate_text_length,
-    sanitize_text,
-    is_valid_bulk_request
-)
-
-__all__ = [
-    'validate_language_code',
-    'validate_text_length',
-    'sanitize_text',
-    'is_valid_bulk_request'
-]
+#Test suite for translation microservice
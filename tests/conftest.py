@@ -0,0 +1,50 @@
+# tests/conftest.py
+"""
+Shared fixtures for the Translation API tests
+"""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session so session-scoped async fixtures can share it"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Single AsyncClient talking to the app in-process, without TestClient's thread hop"""
+    #Imported lazily so collection and -k runs that skip these tests don't load the app
+    from main import app
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as test_client:
+        yield test_client
+
+
+#Read-only GETs are issued once per session and shared by the tests that inspect them
+
+@pytest_asyncio.fixture(scope="session")
+async def health_response(client):
+    return await client.get("/health")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def root_response(client):
+    return await client.get("/")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def languages_response(client):
+    return await client.get("/api/v1/languages")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def stats_response(client):
+    return await client.get("/api/v1/logs/stats")
@@ -3,18 +3,16 @@
 Unit tests for the Translation API
 """
 import pytest
-from fastapi.testclient import TestClient
-from main import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.asyncio
 
 
 class TestHealthEndpoint:
     """Tests for health check endpoint"""
     
-    def test_health_check(self):
+    async def test_health_check(self, health_response):
         """Test health endpoint returns 200"""
-        response = client.get("/health")
+        response = health_response
         assert response.status_code == 200
         
         data = response.json()
@@ -26,20 +24,27 @@ class TestHealthEndpoint:
 class TestRootEndpoint:
     """Tests for root endpoint"""
     
-    def test_root(self):
+    async def test_root(self, root_response):
         """Test root endpoint returns service info"""
-        response = client.get("/")
+        response = root_response
         assert response.status_code == 200
         
         data = response.json()
         assert "service" in data
         assert "endpoints" in data
+    
+    async def test_root_not_modified(self, client, root_response):
+        """Test root endpoint honours its ETag"""
+        etag = root_response.headers["etag"]
+        
+        response = await client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
 
 
 class TestTranslationEndpoint:
     """Tests for translation endpoint"""
     
-    def test_translate_success(self):
+    async def test_translate_success(self, client):
         """Test successful translation"""
         payload = {
             "text": "Hello",
@@ -47,7 +52,7 @@ class TestTranslationEndpoint:
             "source_language": "en"
         }
         
-        response = client.post("/api/v1/translate", json=payload)
+        response = await client.post("/api/v1/translate", json=payload)
         assert response.status_code == 200
         
         data = response.json()
@@ -56,67 +61,41 @@ class TestTranslationEndpoint:
         assert data["source_language"] == "en"
         assert "timestamp" in data
     
-    def test_translate_missing_text(self):
-        """Test translation with missing text"""
-        payload = {
-            "target_language": "ta"
-        }
-        
-        response = client.post("/api/v1/translate", json=payload)
-        assert response.status_code == 422  # Validation error
+    @pytest.mark.parametrize(
+        "payload, expected_status",
+        [
+            ({"target_language": "ta"}, 422),
+            ({"text": "", "target_language": "ta"}, 422),
+            ({"text": "Hello", "target_language": "xyz"}, 400),
+            ({"text": "a" * 1001, "target_language": "ta"}, 422),
+        ],
+        ids=["missing_text", "empty_text", "invalid_language", "text_too_long"]
+    )
+    async def test_translate_validation_errors(self, client, payload, expected_status):
+        """Test translation rejects invalid payloads"""
+        response = await client.post("/api/v1/translate", json=payload)
+        assert response.status_code == expected_status
     
-    def test_translate_empty_text(self):
-        """Test translation with empty text"""
-        payload = {
-            "text": "",
-            "target_language": "ta"
-        }
-        
-        response = client.post("/api/v1/translate", json=payload)
-        assert response.status_code == 422
-    
-    def test_translate_invalid_language(self):
-        """Test translation with invalid language code"""
+    @pytest.mark.parametrize("lang", ["ta", "hi", "kn", "bn"])
+    async def test_translate_multiple_languages(self, client, lang):
+        """Test translation to different languages"""
         payload = {
-            "text": "Hello",
-            "target_language": "xyz"
+            "text": "Thank you",
+            "target_language": lang,
+            "source_language": "en"
         }
         
-        response = client.post("/api/v1/translate", json=payload)
-        assert response.status_code == 400
-    
-    def test_translate_text_too_long(self):
-        """Test translation with text exceeding max length"""
-        payload = {
-            "text": "a" * 1001,
-            "target_language": "ta"
-        }
+        response = await client.post("/api/v1/translate", json=payload)
+        assert response.status_code == 200
         
-        response = client.post("/api/v1/translate", json=payload)
-        assert response.status_code == 422
-    
-    def test_translate_multiple_languages(self):
-        """Test translation to different languages"""
-        languages = ["ta", "hi", "kn", "bn"]
-        
-        for lang in languages:
-            payload = {
-                "text": "Thank you",
-                "target_language": lang,
-                "source_language": "en"
-            }
-            
-            response = client.post("/api/v1/translate", json=payload)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["target_language"] == lang
+        data = response.json()
+        assert data["target_language"] == lang
 
 
 class TestBulkTranslationEndpoint:
     """Tests for bulk translation endpoint"""
     
-    def test_bulk_translate_success(self):
+    async def test_bulk_translate_success(self, client):
         """Test successful bulk translation"""
         payload = {
             "texts": ["Hello", "Thank you", "Goodbye"],
@@ -124,7 +103,7 @@ class TestBulkTranslationEndpoint:
             "source_language": "en"
         }
         
-        response = client.post("/api/v1/translate/bulk", json=payload)
+        response = await client.post("/api/v1/translate/bulk", json=payload)
         assert response.status_code == 200
         
         data = response.json()
@@ -133,50 +112,50 @@ class TestBulkTranslationEndpoint:
         assert data["count"] == 3
         assert data["target_language"] == "ta"
     
-    def test_bulk_translate_empty_list(self):
+    async def test_bulk_translate_empty_list(self, client):
         """Test bulk translation with empty list"""
         payload = {
             "texts": [],
             "target_language": "ta"
         }
         
-        response = client.post("/api/v1/translate/bulk", json=payload)
+        response = await client.post("/api/v1/translate/bulk", json=payload)
         assert response.status_code == 422
     
-    def test_bulk_translate_too_many_items(self):
+    async def test_bulk_translate_too_many_items(self, client):
         """Test bulk translation with too many items"""
         payload = {
             "texts": ["text"] * 51,
             "target_language": "ta"
         }
         
-        response = client.post("/api/v1/translate/bulk", json=payload)
+        response = await client.post("/api/v1/translate/bulk", json=payload)
         assert response.status_code == 400
 
 
 class TestLogsEndpoint:
     """Tests for logs endpoint"""
     
-    def test_get_logs(self):
+    async def test_get_logs(self, client):
         """Test retrieving logs"""
         # First make a translation to create a log
         payload = {
             "text": "Hello",
             "target_language": "ta"
         }
-        client.post("/api/v1/translate", json=payload)
+        await client.post("/api/v1/translate", json=payload)
         
         # Now get logs
-        response = client.get("/api/v1/logs?limit=10")
+        response = await client.get("/api/v1/logs?limit=10")
         assert response.status_code == 200
         
         data = response.json()
         assert "logs" in data
         assert "count" in data
     
-    def test_get_statistics(self):
+    async def test_get_statistics(self, stats_response):
         """Test retrieving statistics"""
-        response = client.get("/api/v1/logs/stats")
+        response = stats_response
         assert response.status_code == 200
         
         data = response.json()
@@ -187,9 +166,9 @@ class TestLogsEndpoint:
 class TestSupportedLanguagesEndpoint:
     """Tests for supported languages endpoint"""
     
-    def test_get_supported_languages(self):
+    async def test_get_supported_languages(self, languages_response):
         """Test retrieving supported languages"""
-        response = client.get("/api/v1/languages")
+        response = languages_response
         assert response.status_code == 200
         
         data = response.json()
@@ -198,5 +177,25 @@ class TestSupportedLanguagesEndpoint:
         assert len(data["languages"]) > 0
 
 
+class TestDebugEndpoint:
+    """Tests for debug cache endpoint"""
+    
+    async def test_cache_info_counts_repeated_translations(self, client):
+        """Test repeated translations are served from the cache"""
+        payload = {
+            "text": "Welcome",
+            "target_language": "kn",
+            "source_language": "en"
+        }
+        await client.post("/api/v1/translate", json=payload)
+        before = (await client.get("/api/v1/debug/cache")).json()["translation_cache"]
+        
+        await client.post("/api/v1/translate", json=payload)
+        after = (await client.get("/api/v1/debug/cache")).json()["translation_cache"]
+        
+        assert after["hits"] == before["hits"] + 1
+        assert after["misses"] == before["misses"]
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
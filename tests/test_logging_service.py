@@ -0,0 +1,138 @@
+# tests/test_logging_service.py
+"""
+Unit tests for the LoggingService
+"""
+import threading
+import time
+
+import pytest
+
+from services.logging_service import LoggingService
+
+
+def log_one(service, text="Hello", target_lang="ta"):
+    return service.log_translation(
+        original_text=text,
+        translated_text=text,
+        source_lang="en",
+        target_lang=target_lang,
+        char_count=len(text)
+    )
+
+
+class TestInMemoryLogs:
+    """Tests for the in-memory log used without a database"""
+    
+    def test_memory_logs_are_bounded(self):
+        """Test the oldest entries are evicted once the limit is reached"""
+        service = LoggingService(use_db=False, memory_log_limit=3)
+        for i in range(5):
+            log_one(service, text=f"text {i}")
+        
+        logs = service.get_logs(limit=10)
+        assert [log["original_text"] for log in logs] == ["text 4", "text 3", "text 2"]
+        assert [log["id"] for log in logs] == [5, 4, 3]
+    
+    @pytest.mark.parametrize(
+        "limit, offset, expected",
+        [
+            (2, 0, ["text 4", "text 3"]),
+            (2, 1, ["text 3", "text 2"]),
+            (5, 3, ["text 1", "text 0"]),
+            (5, 10, []),
+        ],
+        ids=["first_page", "offset", "last_page", "offset_past_end"]
+    )
+    def test_get_logs_paging(self, limit, offset, expected):
+        """Test limit/offset paging returns newest entries first"""
+        service = LoggingService(use_db=False)
+        for i in range(5):
+            log_one(service, text=f"text {i}")
+        
+        logs = service.get_logs(limit=limit, offset=offset)
+        assert [log["original_text"] for log in logs] == expected
+    
+    def test_concurrent_append_and_read(self):
+        """Test reads don't fail while another thread keeps appending"""
+        service = LoggingService(use_db=False, memory_log_limit=100, stats_ttl=0)
+        stop = threading.Event()
+        
+        def writer():
+            while not stop.is_set():
+                log_one(service)
+        
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(300):
+                service.get_logs(limit=50)
+                service.get_statistics()
+        finally:
+            stop.set()
+            thread.join()
+
+
+class TestBulkLogging:
+    """Tests for log_translations_bulk against a database"""
+    
+    @staticmethod
+    def entry(text="Hello"):
+        return {
+            "original_text": text,
+            "translated_text": text,
+            "source_lang": "en",
+            "target_lang": "ta",
+            "char_count": len(text)
+        }
+    
+    def test_bulk_entries_get_row_ids(self, tmp_path):
+        """Test bulk entries carry the ids of the rows they were stored in"""
+        service = LoggingService(db_path=str(tmp_path / "logs.db"))
+        log_one(service, text="single")
+        
+        entries = service.log_translations_bulk([self.entry(f"bulk {i}") for i in range(3)])
+        
+        rows = dict(service._conn.execute("SELECT id, original_text FROM translations"))
+        assert [rows[entry["id"]] for entry in entries] == ["bulk 0", "bulk 1", "bulk 2"]
+        service.close()
+    
+    def test_failed_bulk_insert_rolls_back(self, tmp_path):
+        """Test a failed batch leaves no open transaction and falls back to memory"""
+        service = LoggingService(db_path=str(tmp_path / "logs.db"))
+        bad_entry = dict(self.entry(), original_text=None)  # violates NOT NULL
+        
+        entries = service.log_translations_bulk([self.entry(), bad_entry])
+        
+        assert not service._conn.in_transaction
+        assert service._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 0
+        assert list(service.memory_logs) == entries
+        
+        log_one(service)
+        assert service._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] == 1
+        service.close()
+
+
+class TestStatisticsCache:
+    """Tests for the get_statistics TTL cache"""
+    
+    def test_statistics_cached_until_ttl_expires(self):
+        """Test stats are served from cache within the TTL and refreshed after it"""
+        service = LoggingService(use_db=False, stats_ttl=0.05)
+        log_one(service)
+        assert service.get_statistics()["total_translations"] == 1
+        
+        log_one(service)
+        assert service.get_statistics()["total_translations"] == 1
+        
+        time.sleep(0.06)
+        assert service.get_statistics()["total_translations"] == 2
+    
+    def test_clear_logs_invalidates_cache(self, tmp_path):
+        """Test clearing logs drops the cached statistics"""
+        service = LoggingService(db_path=str(tmp_path / "logs.db"), stats_ttl=60)
+        log_one(service)
+        assert service.get_statistics()["total_translations"] == 1
+        
+        service.clear_logs()
+        assert service.get_statistics()["total_translations"] == 0
+        service.close()
@@ -0,0 +1,34 @@
+# tests/test_translation_service.py
+"""
+Unit tests for the mock TranslationService
+"""
+import pytest
+
+from services.translation_service import TranslationService
+
+
+@pytest.fixture(scope="module")
+def service():
+    return TranslationService()
+
+
+class TestMockTranslation:
+    """Tests for word-by-word mock translation"""
+    
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Hello", "வணக்கம்"),
+            ("Hello, world!", "வணக்கம், world!"),
+            ("yes or no?", "ஆம் or இல்லை?"),
+            ("hello  there\tfriend", "வணக்கம் there friend"),
+        ],
+        ids=["phrase", "punctuation_kept", "several_words", "whitespace_collapsed"]
+    )
+    def test_translate_words(self, service, text, expected):
+        """Test known words are translated and separators normalized"""
+        assert service.translate(text, "ta", "en") == expected
+    
+    def test_untranslatable_text_is_marked(self, service):
+        """Test text with no known words falls back to the mock marker"""
+        assert service.translate("foo bar", "ta", "en") == "[MOCK-TA] foo bar"
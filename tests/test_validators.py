@@ -0,0 +1,31 @@
+# tests/test_validators.py
+"""
+Unit tests for the input validators
+"""
+import pytest
+
+from utils.validators import sanitize_text
+
+
+class TestSanitizeText:
+    """Tests for sanitize_text"""
+    
+    @pytest.mark.parametrize("text", ["Hello", "Hello, how are you?", "வணக்கம் நண்பா", ""])
+    def test_clean_text_returned_unchanged(self, text):
+        """Test already-clean text is returned as the same object"""
+        assert sanitize_text(text) is text
+    
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("  Hello  ", "Hello"),
+            ("Hello   world", "Hello world"),
+            ("Hello\tworld\n", "Hello world"),
+            ("Hel\x00lo", "Hello"),
+            (" \x00 ", ""),
+        ],
+        ids=["outer_spaces", "space_run", "tab_newline", "nul", "only_whitespace"]
+    )
+    def test_dirty_text_cleaned(self, text, expected):
+        """Test NULs are removed and whitespace is collapsed and stripped"""
+        assert sanitize_text(text) == expected
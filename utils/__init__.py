@@ -1,16 +1 @@
-
 #Utilities module for translation microservice
-
-from .validators import (
-    validate_language_code,
-    validate_text_length,
-    sanitize_text,
-    is_valid_bulk_request
-)
-
-__all__ = [
-    'validate_language_code',
-    'validate_text_length',
-    'sanitize_text',
-    'is_valid_bulk_request'
-]
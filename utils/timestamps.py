@@ -0,0 +1,30 @@
+'''Purpose: Cheap UTC timestamps for the request hot path
+What it does:
+
+Formats the current UTC time to second resolution
+Reuses the formatted string until the second rolls over
+Matches the layout SQLite uses for CURRENT_TIMESTAMP'''
+
+import time
+
+
+#Same layout as SQLite's CURRENT_TIMESTAMP so stored values compare as strings
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_last_second = -1
+_last_timestamp = ''
+
+
+def utc_timestamp() -> str:
+    global _last_second, _last_timestamp
+    
+    second = int(time.time())
+    if second != _last_second:
+        _last_timestamp = time.strftime(TIMESTAMP_FORMAT, time.gmtime(second))
+        _last_second = second
+    
+    return _last_timestamp
+
+
+def utc_timestamp_ago(seconds: float) -> str:
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(time.time() - seconds))